@@ -30,6 +30,7 @@ except ImportError:
 try:
     # Import using the 'src.' prefix
     from src.grover_circuit import create_grover_circuit, calculate_optimal_iterations
+    from src.sweep import load_spec, run_sweep
 except ImportError as e:
     print(f"Error importing from src: {e}")
     print("Make sure the 'src' directory exists in the project root and contains the necessary modules.")
@@ -98,8 +99,68 @@ def run_simulation(n_qubits: int, marked_state_binary: str, shots: int = 1024):
     print("----------------------------------")
 
 
+def run_sweep_command(argv: list[str]):
+    """
+    Runs every task described by a JSON/YAML job spec in this process,
+    appending results to a JSON Lines file as they complete.
+    """
+    parser = argparse.ArgumentParser(
+        prog="run_grover.py sweep",
+        description="Run a sweep of Grover simulations from a job spec file."
+    )
+    parser.add_argument("spec", help="Path to the JSON or YAML job spec.")
+    parser.add_argument(
+        "-o", "--output", type=str, default=None,
+        help="Results file (JSON Lines). Overrides the spec's 'output' field."
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Number of worker threads. Overrides the spec's 'workers' field."
+    )
+    parser.add_argument(
+        "--restart", action="store_true",
+        help="Discard existing results instead of resuming from them."
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1.")
+
+    def report(record, done, total):
+        if "error" in record:
+            print(f"[{done}/{total}] {record['id']}: failed: {record['error']}")
+        else:
+            print(f"[{done}/{total}] {record['id']}: "
+                  f"success probability {record['success_probability']:.3f}")
+
+    try:
+        spec = load_spec(args.spec)
+        records = run_sweep(
+            spec,
+            output_path=args.output,
+            workers=args.workers,
+            resume=not args.restart,
+            progress=report,
+        )
+    except (OSError, ImportError, ValueError) as e:
+        print(f"Error running sweep: {e}")
+        sys.exit(1)
+
+    failed = sum("error" in record for record in records)
+    print(f"Sweep finished: {len(records)} task(s) run, {failed} failed.")
+    if failed:
+        print("Re-run the same command to retry the failed tasks.")
+
+
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Run Grover's Algorithm Simulation.")
+    if len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        run_sweep_command(sys.argv[2:])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(
+        description="Run Grover's Algorithm Simulation.",
+        epilog="Use 'run_grover.py sweep <spec>' to run many simulations from a job spec file."
+    )
     parser.add_argument(
         "-n", "--num_qubits", type=int, required=True,
         help="Number of qubits for the search."
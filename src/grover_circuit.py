@@ -6,6 +6,7 @@ from qiskit_aer import AerSimulator
 # Use explicit relative imports
 from .oracle import create_oracle
 from .diffuser import create_diffuser
+from .optimization import optimize_grover_circuit
 
 def calculate_optimal_iterations(num_qubits: int, num_solutions: int = 1) -> int:
     """Calculate the optimal number of Grover iterations.
@@ -79,6 +80,7 @@ def create_grover_circuit(
     measure: bool = True,
     adaptive: bool = False,
     threshold: float = 0.95,
+    optimize: bool = False,
 ) -> QuantumCircuit:
     """Creates the full Grover algorithm circuit.
 
@@ -94,6 +96,9 @@ def create_grover_circuit(
                    on ``threshold``.
         threshold: Success probability threshold used for adaptive iteration
                    count.
+        optimize: If True, inline the Oracle and Diffuser blocks, drop the
+                  separating barriers and fuse the single-qubit gates at each
+                  block boundary (see ``GroverBoundaryOptimization``).
 
     Returns:
         A QuantumCircuit object representing the Grover algorithm.
@@ -158,4 +163,7 @@ def create_grover_circuit(
     if measure:
         grover_circuit.measure(range(num_qubits), classical_register)
 
+    if optimize:
+        grover_circuit = optimize_grover_circuit(grover_circuit)
+
     return grover_circuit 
\ No newline at end of file
@@ -0,0 +1,90 @@
+from typing import Sequence
+from qiskit import QuantumCircuit
+from qiskit.circuit import Barrier
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.passes import Optimize1qGatesDecomposition
+
+# Names given to the sub-circuits by create_oracle and create_diffuser
+GROVER_BLOCK_NAMES = ("Oracle", "Diffuser")
+
+# Gates the single-qubit fusion leaves alone when a run cannot be shortened;
+# anything it does rewrite becomes a single U gate.
+SINGLE_QUBIT_BASIS = ["u", "h", "x", "z"]
+
+
+class GroverBoundaryOptimization(TransformationPass):
+    """Expose the single-qubit layers at Grover oracle/diffuser boundaries.
+
+    ``create_grover_circuit`` appends the oracle and diffuser as opaque blocks
+    separated by barriers. The oracle ends with X gates on the qubits marked
+    '0' (and an H on the MCZ target), and the diffuser starts with H and X on
+    every qubit, so these layers never merge. This pass:
+
+    1. Removes barriers directly before or after a block named in
+       ``block_names``. These only separate the blocks visually; barriers
+       elsewhere in the circuit are left untouched.
+    2. Inlines those blocks.
+
+    Follow it with a single-qubit optimization pass to fuse the now adjacent
+    layers, as ``optimize_grover_circuit`` does.
+
+    The number of barriers removed and blocks inlined is stored in the property
+    set under ``"grover_boundary_optimization"``.
+    """
+
+    def __init__(self, block_names: Sequence[str] = GROVER_BLOCK_NAMES):
+        super().__init__()
+        self.block_names = tuple(block_names)
+
+    def run(self, dag: DAGCircuit) -> DAGCircuit:
+        barriers_removed = self._remove_block_barriers(dag)
+        blocks_inlined = self._inline_blocks(dag)
+
+        self.property_set["grover_boundary_optimization"] = {
+            "barriers_removed": barriers_removed,
+            "blocks_inlined": blocks_inlined,
+        }
+        return dag
+
+    def _is_block(self, node) -> bool:
+        return node.op.name in self.block_names and node.op.definition is not None
+
+    def _remove_block_barriers(self, dag: DAGCircuit) -> int:
+        removed = 0
+        for node in dag.op_nodes(Barrier):
+            neighbours = list(dag.op_predecessors(node)) + list(dag.op_successors(node))
+            if any(self._is_block(neighbour) for neighbour in neighbours):
+                dag.remove_op_node(node)
+                removed += 1
+        return removed
+
+    def _inline_blocks(self, dag: DAGCircuit) -> int:
+        inlined = 0
+        for node in dag.op_nodes():
+            if self._is_block(node):
+                dag.substitute_node_with_dag(node, circuit_to_dag(node.op.definition))
+                inlined += 1
+        return inlined
+
+
+def optimize_grover_circuit(circuit: QuantumCircuit) -> QuantumCircuit:
+    """Inline the Grover blocks and fuse the single-qubit gates between them.
+
+    Runs ``GroverBoundaryOptimization`` followed by Qiskit's
+    ``Optimize1qGatesDecomposition``, which replaces each run of adjacent
+    single-qubit gates with at most one gate whenever that is shorter.
+
+    Args:
+        circuit: A circuit built by ``create_grover_circuit``.
+
+    Returns:
+        The optimized circuit. The input circuit is not modified.
+    """
+    pass_manager = PassManager([
+        GroverBoundaryOptimization(),
+        Optimize1qGatesDecomposition(basis=SINGLE_QUBIT_BASIS),
+    ])
+    return pass_manager.run(circuit)
@@ -1,5 +1,8 @@
+from typing import Any
 from qiskit import QuantumCircuit
 
+from .optimization import GROVER_BLOCK_NAMES
+
 def get_circuit_depth(circuit: QuantumCircuit) -> int:
     """Calculate the depth of a quantum circuit.
 
@@ -40,4 +43,52 @@ def print_performance_metrics(circuit: QuantumCircuit):
     print(f"Circuit Performance Metrics:")
     print(f"- Depth: {depth}")
     print(f"- Gate Counts: {counts}")
-    # Add more metrics as needed 
\ No newline at end of file
+    # Add more metrics as needed 
+
+def get_optimization_metrics(original: QuantumCircuit, optimized: QuantumCircuit) -> dict[str, Any]:
+    """Compare gate count and depth before and after optimization.
+
+    The Oracle and Diffuser blocks of ``original`` are decomposed first so that
+    both circuits are measured at the same level of detail.
+
+    Args:
+        original: The circuit before optimization.
+        optimized: The circuit after optimization.
+
+    Returns:
+        A dictionary with the depth, gate count and gate counts by type of
+        each circuit, plus the reductions in depth and size. Barriers are
+        excluded from both the gate count and the counts by type.
+    """
+    original = original.decompose(gates_to_decompose=list(GROVER_BLOCK_NAMES))
+
+    depth_before = get_circuit_depth(original)
+    depth_after = get_circuit_depth(optimized)
+    size_before = original.size()
+    size_after = optimized.size()
+
+    return {
+        "depth_before": depth_before,
+        "depth_after": depth_after,
+        "depth_reduction": depth_before - depth_after,
+        "size_before": size_before,
+        "size_after": size_after,
+        "size_reduction": size_before - size_after,
+        "gate_counts_before": {
+            name: count for name, count in get_gate_counts(original).items() if name != "barrier"
+        },
+        "gate_counts_after": {
+            name: count for name, count in get_gate_counts(optimized).items() if name != "barrier"
+        },
+    }
+
+def print_optimization_metrics(original: QuantumCircuit, optimized: QuantumCircuit):
+    """Prints the reduction in depth and gate count achieved by optimization."""
+    metrics = get_optimization_metrics(original, optimized)
+
+    print(f"Circuit Optimization Metrics:")
+    print(f"- Depth: {metrics['depth_before']} -> {metrics['depth_after']} "
+          f"({-metrics['depth_reduction']:+d})")
+    print(f"- Gates: {metrics['size_before']} -> {metrics['size_after']} "
+          f"({-metrics['size_reduction']:+d})")
+    print(f"- Gate Counts: {metrics['gate_counts_before']} -> {metrics['gate_counts_after']}")
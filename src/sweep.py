@@ -0,0 +1,450 @@
+"""Run many Grover experiments from a declarative job specification.
+
+A job spec is a JSON (or YAML, if PyYAML is installed) document such as::
+
+    {
+        "backend": "automatic",
+        "shots": 1024,
+        "workers": 4,
+        "output": "results.jsonl",
+        "jobs": [
+            {
+                "name": "small",
+                "num_qubits": {"min": 2, "max": 4},
+                "targets": {"generator": "random", "count": 3, "seed": 7},
+                "iterations": ["optimal", "adaptive", 1]
+            }
+        ]
+    }
+
+Every job is expanded into individual tasks (one per qubit count, target set
+and iteration strategy). Tasks run in a thread pool inside a single process so
+the simulator and iteration counts are shared between them. Results are
+appended to a JSON Lines file as soon as each task completes; re-running the
+same spec skips tasks whose ids are already present in that file.
+"""
+
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
+
+from qiskit import transpile
+from qiskit_aer import AerSimulator
+
+from .grover_circuit import (
+    calculate_dynamic_iterations,
+    calculate_optimal_iterations,
+    create_grover_circuit,
+)
+
+DEFAULTS = {
+    "backend": "automatic",
+    "shots": 1024,
+    "threshold": 0.95,
+    "iterations": "optimal",
+    "workers": 1,
+    "output": "sweep_results.jsonl",
+}
+
+TARGET_GENERATORS = ("all", "random", "explicit")
+ITERATION_STRATEGIES = ("optimal", "adaptive")
+
+# Aer methods that cannot run the measured circuits every task builds
+UNSUPPORTED_BACKENDS = ("unitary", "superop")
+
+
+@dataclass(frozen=True)
+class SweepTask:
+    """A single Grover run produced by expanding a job."""
+
+    task_id: str
+    num_qubits: int
+    targets: tuple[str, ...]
+    iterations: int | str
+    shots: int
+    backend: str
+    threshold: float
+
+
+def load_spec(path: str) -> dict[str, Any]:
+    """Load a job spec from a JSON or YAML file.
+
+    Args:
+        path: Path to the spec. Files ending in ``.yaml`` or ``.yml`` are
+            parsed with PyYAML, everything else as JSON.
+
+    Returns:
+        The parsed spec as a dictionary.
+
+    Raises:
+        ImportError: If a YAML spec is given and PyYAML is not installed.
+        ValueError: If the file cannot be parsed or does not contain a mapping.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError(
+                    "PyYAML is required for YAML job specs. Install it using: pip install pyyaml"
+                ) from e
+            try:
+                spec = yaml.safe_load(handle)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Could not parse YAML job spec: {e}") from e
+        else:
+            # json.JSONDecodeError is already a ValueError
+            spec = json.load(handle)
+
+    if not isinstance(spec, dict):
+        raise ValueError("Job spec must be a mapping at the top level.")
+    return spec
+
+
+def _positive_int(value: Any, field: str) -> int:
+    """Check that a spec field is an integer >= 1."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"{field} must be a positive integer, got {value!r}.")
+    return value
+
+
+def _qubit_counts(value: Any) -> list[int]:
+    """Normalise the ``num_qubits`` field of a job into a list of ints."""
+    if isinstance(value, int):
+        counts = [value]
+    elif isinstance(value, dict):
+        if "min" not in value or "max" not in value:
+            raise ValueError("num_qubits range must define both 'min' and 'max'.")
+        bounds = [_positive_int(value[key], f"num_qubits {key}") for key in ("min", "max")]
+        step = _positive_int(value.get("step", 1), "num_qubits step")
+        counts = list(range(bounds[0], bounds[1] + 1, step))
+    elif isinstance(value, list):
+        counts = list(value)
+    else:
+        raise ValueError(f"Unsupported num_qubits value: {value!r}")
+
+    if not counts or any(isinstance(n, bool) or not isinstance(n, int) or n < 1 for n in counts):
+        raise ValueError("num_qubits must contain at least one integer >= 1.")
+    return counts
+
+
+def _normalise_targets(spec: Any, qubit_counts: list[int]) -> dict[str, Any]:
+    """Validate the ``targets`` field of a job against its qubit counts.
+
+    Explicit states are checked once for the whole job: each group must be
+    non-empty, binary, free of duplicates and of a single length that is one
+    of the job's qubit counts.
+    """
+    if isinstance(spec, str):
+        spec = {"generator": spec}
+    elif isinstance(spec, list):
+        spec = {"generator": "explicit", "states": spec}
+    elif not isinstance(spec, dict):
+        raise ValueError(f"targets must be a string, list or mapping, got {spec!r}.")
+
+    generator = spec.get("generator")
+    if generator not in TARGET_GENERATORS:
+        raise ValueError(
+            f"Unknown target generator {generator!r}; expected one of {TARGET_GENERATORS}."
+        )
+    if generator != "explicit":
+        return spec
+
+    states = spec.get("states", [])
+    if not isinstance(states, list) or not states:
+        raise ValueError(f"targets states must be a non-empty list, got {states!r}.")
+    groups = []
+    for s in states:
+        group = (s,) if isinstance(s, str) else tuple(s) if isinstance(s, list) else None
+        if not group or not all(isinstance(state, str) for state in group):
+            raise ValueError(f"Target states must be strings or non-empty lists of strings, got {s!r}.")
+        if not all(c in "01" for state in group for c in state):
+            raise ValueError(f"Target states {group} must be binary strings.")
+        if len(set(group)) != len(group):
+            raise ValueError(f"Target states {group} contain a duplicate state.")
+        lengths = {len(state) for state in group}
+        if len(lengths) != 1:
+            raise ValueError(f"Target states {group} must all have the same length.")
+        if lengths.pop() not in qubit_counts:
+            raise ValueError(
+                f"Target states {group} do not match any of the job's qubit counts {qubit_counts}."
+            )
+        groups.append(group)
+    return {"generator": "explicit", "states": groups}
+
+
+def _target_sets(num_qubits: int, spec: dict[str, Any]) -> list[tuple[str, ...]]:
+    """Generate the marked-state sets for one qubit count.
+
+    ``spec`` must already have been checked by ``_normalise_targets``.
+    """
+    generator = spec["generator"]
+    n_states = 2 ** num_qubits
+    if generator == "all":
+        return [(format(i, f"0{num_qubits}b"),) for i in range(n_states)]
+
+    if generator == "random":
+        solutions = _positive_int(spec.get("solutions", 1), "targets solutions")
+        count = _positive_int(spec.get("count", 1), "targets count")
+        if solutions > n_states:
+            raise ValueError("solutions must be between 1 and 2**num_qubits")
+        # Seed per qubit count so adding sizes to a sweep keeps earlier task ids stable.
+        rng = random.Random(f"{spec.get('seed', 0)}:{num_qubits}")
+        sets = []
+        for _ in range(count):
+            indices = sorted(rng.sample(range(n_states), solutions))
+            sets.append(tuple(format(i, f"0{num_qubits}b") for i in indices))
+        return sets
+
+    # Explicit states for the other sizes of a multi-size job are skipped here
+    return [group for group in spec["states"] if len(group[0]) == num_qubits]
+
+
+def _iteration_strategies(value: Any) -> list[int | str]:
+    """Normalise the ``iterations`` field of a job into a list."""
+    values = value if isinstance(value, list) else [value]
+    if not values:
+        raise ValueError("iterations must contain at least one strategy.")
+    for v in values:
+        if isinstance(v, bool) or not (isinstance(v, int) or v in ITERATION_STRATEGIES):
+            raise ValueError(
+                f"Unsupported iteration strategy {v!r}; expected an int or one of {ITERATION_STRATEGIES}."
+            )
+        if isinstance(v, int) and v < 0:
+            raise ValueError("Iteration counts must be non-negative.")
+    return values
+
+
+def expand_spec(spec: dict[str, Any]) -> list[SweepTask]:
+    """Expand a job spec into the flat list of tasks it describes.
+
+    Top-level ``backend``, ``shots``, ``threshold`` and ``iterations`` act as
+    defaults that individual jobs may override. The whole spec is validated
+    here, so nothing is run or written if any job is malformed.
+
+    Raises:
+        ValueError: If the spec is malformed.
+    """
+    jobs = spec.get("jobs")
+    if not jobs or not isinstance(jobs, list):
+        raise ValueError("Job spec must define a non-empty 'jobs' list.")
+
+    backends = [
+        method for method in AerSimulator().available_methods()
+        if method not in UNSUPPORTED_BACKENDS
+    ]
+
+    defaults = {key: spec.get(key, DEFAULTS[key]) for key in ("backend", "shots", "threshold", "iterations")}
+
+    tasks: list[SweepTask] = []
+    seen: set[str] = set()
+    for index, job in enumerate(jobs):
+        if not isinstance(job, dict):
+            raise ValueError(f"Job {index} must be a mapping, got {job!r}.")
+        settings = {key: job.get(key, default) for key, default in defaults.items()}
+        name = job.get("name", f"job{index}")
+        if "num_qubits" not in job:
+            raise ValueError(f"Job {name!r} must define 'num_qubits'.")
+        _positive_int(settings["shots"], f"Job {name!r}: shots")
+        if settings["backend"] not in backends:
+            raise ValueError(
+                f"Job {name!r}: unknown backend {settings['backend']!r}; expected one of {backends}."
+            )
+        threshold = settings["threshold"]
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or not 0 < threshold <= 1:
+            raise ValueError(f"Job {name!r}: threshold must be a number in (0, 1], got {threshold!r}.")
+
+        strategies = _iteration_strategies(settings["iterations"])
+        qubit_counts = _qubit_counts(job["num_qubits"])
+        targets_spec = _normalise_targets(job.get("targets", "all"), qubit_counts)
+        for num_qubits in qubit_counts:
+            for targets in _target_sets(num_qubits, targets_spec):
+                for strategy in strategies:
+                    if strategy == "adaptive" and len(targets) != 1:
+                        raise ValueError(
+                            f"Job {name!r}: adaptive iterations support a single target state only."
+                        )
+                    label = f"adaptive@{settings['threshold']}" if strategy == "adaptive" else strategy
+                    task_id = (
+                        f"{name}/n={num_qubits}/targets={','.join(targets)}"
+                        f"/iterations={label}/shots={settings['shots']}/backend={settings['backend']}"
+                    )
+                    if task_id in seen:
+                        continue
+                    seen.add(task_id)
+                    tasks.append(
+                        SweepTask(
+                            task_id=task_id,
+                            num_qubits=num_qubits,
+                            targets=targets,
+                            iterations=strategy,
+                            shots=settings["shots"],
+                            backend=settings["backend"],
+                            threshold=settings["threshold"],
+                        )
+                    )
+    return tasks
+
+
+@lru_cache(maxsize=None)
+def _get_simulator(method: str) -> AerSimulator:
+    """Return a shared simulator instance for the given Aer method."""
+    return AerSimulator(method=method)
+
+
+@lru_cache(maxsize=None)
+def _optimal_iterations(num_qubits: int, num_solutions: int) -> int:
+    return calculate_optimal_iterations(num_qubits, num_solutions)
+
+
+@lru_cache(maxsize=None)
+def _adaptive_iterations(num_qubits: int, target: str, threshold: float) -> int:
+    return calculate_dynamic_iterations(num_qubits, target, threshold=threshold)
+
+
+def _resolve_iterations(task: SweepTask) -> int:
+    if task.iterations == "optimal":
+        return _optimal_iterations(task.num_qubits, len(task.targets))
+    if task.iterations == "adaptive":
+        return _adaptive_iterations(task.num_qubits, task.targets[0], task.threshold)
+    return task.iterations
+
+
+def run_task(task: SweepTask) -> dict[str, Any]:
+    """Build, simulate and summarise a single sweep task.
+
+    Returns:
+        A JSON-serialisable record of the run.
+    """
+    start = time.perf_counter()
+    num_iterations = _resolve_iterations(task)
+    circuit = create_grover_circuit(
+        task.num_qubits,
+        list(task.targets),
+        iterations=num_iterations,
+        measure=True,
+    )
+
+    simulator = _get_simulator(task.backend)
+    compiled_circuit = transpile(circuit, simulator)
+    counts = simulator.run(compiled_circuit, shots=task.shots).result().get_counts()
+
+    return {
+        "id": task.task_id,
+        "num_qubits": task.num_qubits,
+        "targets": list(task.targets),
+        "iteration_strategy": task.iterations,
+        "iterations": num_iterations,
+        "shots": task.shots,
+        "backend": task.backend,
+        "depth": compiled_circuit.depth(),
+        "success_probability": sum(counts.get(t, 0) for t in task.targets) / task.shots,
+        "most_frequent": max(counts, key=counts.get),
+        "counts": counts,
+        "elapsed_seconds": time.perf_counter() - start,
+    }
+
+
+def completed_task_ids(output_path: str) -> set[str]:
+    """Read the ids of tasks already recorded in a results file.
+
+    Error records and a truncated final line (e.g. from an interrupted run)
+    are ignored so the corresponding tasks are simply run again.
+    """
+    if not os.path.exists(output_path):
+        return set()
+
+    done = set()
+    with open(output_path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+                if "error" not in record:
+                    done.add(record["id"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+    return done
+
+
+def _terminate_partial_line(output_path: str) -> None:
+    """End a results file with a newline if its last record was cut short.
+
+    Without this the first appended record would be glued onto the broken
+    fragment and neither would be readable on the next resume.
+    """
+    if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+        return
+    with open(output_path, "rb+") as handle:
+        handle.seek(-1, os.SEEK_END)
+        if handle.read(1) != b"\n":
+            handle.write(b"\n")
+
+
+def run_sweep(
+    spec: dict[str, Any],
+    output_path: str | None = None,
+    workers: int | None = None,
+    resume: bool = True,
+    progress: Callable[[dict[str, Any], int, int], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Run every task in a job spec, appending results to a JSON Lines file.
+
+    Args:
+        spec: The parsed job spec.
+        output_path: Results file. Defaults to the spec's ``output`` field.
+        workers: Size of the thread pool. Defaults to the spec's ``workers``.
+        resume: If True, skip tasks already recorded in ``output_path``.
+            Otherwise the file is truncated before the sweep starts.
+        progress: Optional callback invoked as ``progress(record, done, total)``
+            after each task is written.
+
+    A task that raises does not stop the sweep: an ``{"id": ..., "error": ...}``
+    record is written in its place and the task is retried on resume.
+
+    Returns:
+        The records produced by this run, in completion order.
+
+    Raises:
+        ValueError: If the spec is malformed or ``workers`` is less than 1.
+    """
+    tasks = expand_spec(spec)
+    output_path = output_path or spec.get("output", DEFAULTS["output"])
+    if workers is None:
+        workers = spec.get("workers", DEFAULTS["workers"])
+    workers = _positive_int(workers, "workers")
+
+    if resume:
+        done = completed_task_ids(output_path)
+        pending = [task for task in tasks if task.task_id not in done]
+        _terminate_partial_line(output_path)
+    else:
+        pending = tasks
+    total = len(pending)
+
+    records = []
+    mode = "a" if resume else "w"
+    with open(output_path, mode, encoding="utf-8") as handle, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_task, task): task for task in pending}
+        try:
+            for finished, future in enumerate(as_completed(futures), start=1):
+                try:
+                    record = future.result()
+                except Exception as e:
+                    record = {"id": futures[future].task_id, "error": str(e)}
+                handle.write(json.dumps(record) + "\n")
+                handle.flush()
+                records.append(record)
+                if progress is not None:
+                    progress(record, finished, total)
+        except BaseException:
+            # e.g. KeyboardInterrupt: results written so far stay on disk and a
+            # resumed run picks up from there.
+            for future in futures:
+                future.cancel()
+            raise
+    return records
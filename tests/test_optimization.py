@@ -0,0 +1,102 @@
+import pytest
+from qiskit import QuantumCircuit, transpile
+from qiskit.quantum_info import Operator
+from qiskit.transpiler import PassManager
+from qiskit_aer import AerSimulator
+
+from src.grover_circuit import create_grover_circuit
+from src.optimization import GroverBoundaryOptimization
+from src.performance import get_optimization_metrics, print_optimization_metrics
+
+simulator = AerSimulator(method="automatic")
+
+TEST_CASES = [
+    {"num_qubits": 1, "targets": "0"},
+    {"num_qubits": 2, "targets": "01"},
+    {"num_qubits": 3, "targets": "101"},
+    {"num_qubits": 4, "targets": ["0000", "1010"]},
+]
+
+
+@pytest.mark.parametrize("case", TEST_CASES)
+def test_optimized_circuit_is_equivalent(case):
+    """The optimized circuit must implement exactly the same unitary."""
+    original = create_grover_circuit(case["num_qubits"], case["targets"], measure=False)
+    optimized = create_grover_circuit(
+        case["num_qubits"], case["targets"], measure=False, optimize=True
+    )
+
+    assert Operator(original) == Operator(optimized)
+
+    counts = optimized.count_ops()
+    assert "barrier" not in counts
+    assert "Oracle" not in counts and "Diffuser" not in counts
+
+
+@pytest.mark.parametrize("case", TEST_CASES[1:])
+def test_optimization_reduces_gate_count_and_depth(case):
+    original = create_grover_circuit(case["num_qubits"], case["targets"])
+    optimized = create_grover_circuit(case["num_qubits"], case["targets"], optimize=True)
+
+    metrics = get_optimization_metrics(original, optimized)
+    assert metrics["size_reduction"] > 0
+    assert metrics["depth_reduction"] > 0
+    assert metrics["gate_counts_before"]["measure"] == metrics["gate_counts_after"]["measure"]
+
+
+def test_optimized_grover_finds_target_state():
+    num_qubits = 3
+    target = "110"
+    shots = 1024
+
+    circuit = create_grover_circuit(num_qubits, target, optimize=True)
+    t_circuit = transpile(circuit, simulator)
+    counts = simulator.run(t_circuit, shots=shots).result().get_counts()
+
+    assert max(counts, key=counts.get) == target
+    assert counts.get(target, 0) / shots > 0.7
+
+
+def test_pass_only_removes_barriers_next_to_grover_blocks():
+    grover = create_grover_circuit(2, "11", iterations=1, measure=False)
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.barrier()
+    qc.h(0)
+    qc.compose(grover, inplace=True)
+
+    pass_manager = PassManager([GroverBoundaryOptimization()])
+    optimized = pass_manager.run(qc)
+
+    # The user's barrier between the two H gates is not next to a block
+    assert optimized.count_ops()["barrier"] == 1
+    assert Operator(qc) == Operator(optimized)
+    assert pass_manager.property_set["grover_boundary_optimization"] == {
+        "barriers_removed": 3,
+        "blocks_inlined": 2,
+    }
+
+
+def test_optimization_metrics_exclude_barriers():
+    original = create_grover_circuit(3, "101")
+    optimized = create_grover_circuit(3, "101", optimize=True)
+
+    metrics = get_optimization_metrics(original, optimized)
+    assert "barrier" not in metrics["gate_counts_before"]
+    assert sum(metrics["gate_counts_before"].values()) == metrics["size_before"]
+    assert sum(metrics["gate_counts_after"].values()) == metrics["size_after"]
+
+
+def test_print_optimization_metrics_shows_signed_difference(capsys):
+    smaller = QuantumCircuit(1)
+    larger = QuantumCircuit(1)
+    larger.h(0)
+    larger.x(0)
+
+    print_optimization_metrics(larger, smaller)
+    print_optimization_metrics(smaller, larger)
+    output = capsys.readouterr().out
+
+    assert "- Gates: 2 -> 0 (-2)" in output
+    assert "- Gates: 0 -> 2 (+2)" in output
+    assert "--" not in output.replace("->", "")
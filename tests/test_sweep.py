@@ -0,0 +1,203 @@
+import json
+
+import pytest
+
+import src.sweep
+from src.sweep import completed_task_ids, expand_spec, load_spec, run_sweep
+
+
+SPEC = {
+    "shots": 256,
+    "jobs": [
+        {
+            "name": "all2",
+            "num_qubits": 2,
+            "targets": "all",
+            "iterations": ["optimal", 0],
+        },
+        {
+            "name": "random",
+            "num_qubits": {"min": 3, "max": 4},
+            "targets": {"generator": "random", "count": 2, "seed": 3},
+            "iterations": "adaptive",
+            "threshold": 0.8,
+        },
+    ],
+}
+
+
+def test_expand_spec_counts_and_defaults():
+    tasks = expand_spec(SPEC)
+
+    # 4 targets x 2 strategies for n=2, plus 2 random targets x 2 sizes
+    assert len(tasks) == 8 + 4
+    assert len({t.task_id for t in tasks}) == len(tasks)
+    assert all(t.shots == 256 and t.backend == "automatic" for t in tasks)
+
+    random_tasks = [t for t in tasks if t.task_id.startswith("random/")]
+    assert {t.num_qubits for t in random_tasks} == {3, 4}
+    assert all(t.threshold == 0.8 for t in random_tasks)
+
+
+def test_expand_spec_is_deterministic():
+    first = [t.task_id for t in expand_spec(SPEC)]
+    second = [t.task_id for t in expand_spec(SPEC)]
+    assert first == second
+
+
+def test_expand_spec_invalid_input():
+    with pytest.raises(ValueError, match="non-empty 'jobs'"):
+        expand_spec({"jobs": []})
+    with pytest.raises(ValueError, match="Unknown target generator"):
+        expand_spec({"jobs": [{"num_qubits": 2, "targets": {"generator": "nope"}}]})
+    with pytest.raises(ValueError, match="do not match any of the job's qubit counts"):
+        expand_spec({"jobs": [{"num_qubits": 3, "targets": ["10"]}]})
+    with pytest.raises(ValueError, match="single target state"):
+        expand_spec({"jobs": [{"num_qubits": 3, "targets": [["101", "010"]], "iterations": "adaptive"}]})
+    with pytest.raises(ValueError, match="Unsupported iteration strategy"):
+        expand_spec({"jobs": [{"num_qubits": 2, "iterations": "fastest"}]})
+
+
+@pytest.mark.parametrize(
+    "job, message",
+    [
+        ({"num_qubits": 2, "shots": "10"}, "shots must be a positive integer"),
+        ({"num_qubits": 2, "targets": 5}, "targets must be a string, list or mapping"),
+        ({"num_qubits": 2, "threshold": 1.5}, r"threshold must be a number in \(0, 1\]"),
+        ({"num_qubits": 2, "backend": "statevectr"}, "unknown backend"),
+        ({"num_qubits": 2, "backend": "unitary"}, "unknown backend"),
+        ({"num_qubits": 2, "iterations": []}, "at least one strategy"),
+        ({"num_qubits": 2, "targets": {"generator": "random", "count": "3"}}, "count must be a positive integer"),
+        ({"num_qubits": 2, "targets": {"generator": "random", "solutions": 0}}, "solutions must be a positive integer"),
+    ],
+)
+def test_expand_spec_rejects_bad_fields(job, message):
+    with pytest.raises(ValueError, match=message):
+        expand_spec({"jobs": [job]})
+
+
+@pytest.mark.parametrize(
+    "num_qubits, targets, message",
+    [
+        (3, ["101", "10"], "do not match any of the job's qubit counts"),
+        ([2, 3], [["101", "01"]], "must all have the same length"),
+        (3, [["101", "101"]], "duplicate state"),
+        (3, ["1a1"], "must be binary strings"),
+        (3, [[]], "non-empty lists of strings"),
+    ],
+)
+def test_expand_spec_rejects_bad_explicit_targets(num_qubits, targets, message):
+    with pytest.raises(ValueError, match=message):
+        expand_spec({"jobs": [{"num_qubits": num_qubits, "targets": targets}]})
+
+
+def test_expand_spec_assigns_explicit_targets_by_length():
+    tasks = expand_spec({"jobs": [{"num_qubits": [2, 3], "targets": ["11", ["101", "010"]]}]})
+    assert [(t.num_qubits, t.targets) for t in tasks] == [(2, ("11",)), (3, ("101", "010"))]
+
+
+def test_run_sweep_rejects_zero_workers(tmp_path):
+    with pytest.raises(ValueError, match="workers must be a positive integer"):
+        run_sweep(
+            {"workers": 2, "jobs": [{"num_qubits": 2}]},
+            output_path=str(tmp_path / "results.jsonl"),
+            workers=0,
+        )
+
+
+def test_invalid_spec_does_not_truncate_results(tmp_path):
+    output = tmp_path / "results.jsonl"
+    output.write_text('{"id": "a"}\n{"id": "b"}\n')
+
+    with pytest.raises(ValueError, match="unknown backend"):
+        run_sweep(
+            {"backend": "statevectr", "jobs": [{"num_qubits": 2}]},
+            output_path=str(output),
+            resume=False,
+        )
+    assert len(output.read_text().splitlines()) == 2
+
+
+def test_run_sweep_writes_results_and_resumes(tmp_path):
+    output = tmp_path / "results.jsonl"
+    spec = {
+        "shots": 512,
+        "workers": 2,
+        "jobs": [{"num_qubits": [2, 3], "targets": ["11", "101"]}],
+    }
+
+    records = run_sweep(spec, output_path=str(output))
+    assert len(records) == 2
+    for record in records:
+        assert record["most_frequent"] == record["targets"][0]
+        assert record["success_probability"] > 0.7
+
+    lines = output.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [r["id"] for r in records]
+
+    # Simulate an interrupted run by dropping the last result
+    output.write_text(lines[0] + "\n")
+    resumed = run_sweep(spec, output_path=str(output))
+    assert len(resumed) == 1
+    assert completed_task_ids(str(output)) == {r["id"] for r in records}
+
+    # Nothing left to do once every task is recorded
+    assert run_sweep(spec, output_path=str(output)) == []
+
+
+def test_run_sweep_resumes_after_truncated_record(tmp_path):
+    output = tmp_path / "results.jsonl"
+    spec = {"shots": 128, "jobs": [{"num_qubits": 2, "targets": ["01", "10"]}]}
+
+    records = run_sweep(spec, output_path=str(output))
+    first, second = output.read_text().splitlines()
+
+    # Simulate a crash in the middle of writing the second record
+    output.write_text(first + "\n" + second[: len(second) // 2])
+    resumed = run_sweep(spec, output_path=str(output))
+
+    assert [r["id"] for r in resumed] == [records[1]["id"]]
+    assert completed_task_ids(str(output)) == {r["id"] for r in records}
+    assert run_sweep(spec, output_path=str(output)) == []
+
+
+def test_load_spec_json(tmp_path):
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(SPEC))
+    assert load_spec(str(path)) == SPEC
+
+    path.write_text("[]")
+    with pytest.raises(ValueError, match="mapping"):
+        load_spec(str(path))
+
+
+def test_load_spec_invalid_yaml(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "spec.yaml"
+    path.write_text("jobs: [\n")
+    with pytest.raises(ValueError, match="Could not parse YAML"):
+        load_spec(str(path))
+
+
+def test_run_sweep_records_failed_tasks_and_retries_them(tmp_path, monkeypatch):
+    output = tmp_path / "results.jsonl"
+    spec = {"shots": 128, "jobs": [{"num_qubits": 2, "targets": ["01", "10"]}]}
+    run_task = src.sweep.run_task
+
+    def flaky_run_task(task):
+        if "targets=01" in task.task_id:
+            raise RuntimeError("simulator exploded")
+        return run_task(task)
+
+    monkeypatch.setattr(src.sweep, "run_task", flaky_run_task)
+    records = run_sweep(spec, output_path=str(output), workers=2)
+
+    errors = [r for r in records if "error" in r]
+    assert len(records) == 2
+    assert len(errors) == 1 and errors[0]["error"] == "simulator exploded"
+    assert len(completed_task_ids(str(output))) == 1
+
+    monkeypatch.setattr(src.sweep, "run_task", run_task)
+    retried = run_sweep(spec, output_path=str(output))
+    assert [r["id"] for r in retried] == [errors[0]["id"]]
+    assert "error" not in retried[0]